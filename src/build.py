@@ -3,6 +3,7 @@
 import argparse
 import dataclasses
 import enum
+import hashlib
 import logging
 import pathlib
 import subprocess
@@ -74,14 +75,35 @@ def action_make(
     current_dir: pathlib.Path, build_dir: pathlib.Path, args: Args, argv: list[str]
 ) -> int:
     build_dir.mkdir(exist_ok=True)
-    rc = run_cmake(current_dir, build_dir, args.exec_dir)
-    if rc:
-        return rc
+
+    hash_file = build_dir / '.cmake_inputs.hash'
+    inputs_hash = hash_cmake_inputs(current_dir, args.exec_dir)
+    if cmake_needed(build_dir, hash_file, inputs_hash):
+        rc = run_cmake(current_dir, build_dir, args.exec_dir)
+        if rc:
+            return rc
+        hash_file.write_text(inputs_hash)
+    else:
+        logging.info('CMakeLists.txt unchanged, skipping cmake')
 
     rc = run_make(build_dir, args.sudo, argv)
     return rc
 
 
+def hash_cmake_inputs(current_dir: pathlib.Path, exec_dir: pathlib.Path | None) -> str:
+    digest = hashlib.blake2b((current_dir / 'CMakeLists.txt').read_bytes())
+    digest.update(str(exec_dir).encode())
+    return digest.hexdigest()
+
+
+def cmake_needed(
+    build_dir: pathlib.Path, hash_file: pathlib.Path, inputs_hash: str
+) -> bool:
+    if not (build_dir / 'CMakeCache.txt').exists():
+        return True
+    return not hash_file.exists() or hash_file.read_text() != inputs_hash
+
+
 def action_ctest(
     current_dir: pathlib.Path, build_dir: pathlib.Path, args: Args, argv: list[str]
 ) -> int: